@@ -14,6 +14,10 @@ class Settings(BaseSettings):
     rate_limit_requests: int = Field(60, alias="RATE_LIMIT_REQUESTS")
     rate_limit_window_seconds: int = Field(60, alias="RATE_LIMIT_WINDOW_SECONDS")
     debug_openai_payload: bool = Field(False, alias="OPENAI_DEBUG_PAYLOAD")
+    prompt_max_tokens: int = Field(25, alias="PROMPT_MAX_TOKENS")
+    prompt_max_key_phrases: int = Field(10, alias="PROMPT_MAX_KEY_PHRASES")
+    warmup_openai_connection: bool = Field(True, alias="OPENAI_WARMUP_CONNECTION")
+    warmup_timeout: int = Field(5, alias="OPENAI_WARMUP_TIMEOUT_SECONDS")
 
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
 
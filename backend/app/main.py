@@ -1,16 +1,56 @@
 from __future__ import annotations
 
-from fastapi import Depends, FastAPI, Form, HTTPException, UploadFile, status
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager, suppress
+from typing import AsyncIterator
+
+from fastapi import Depends, FastAPI, Form, HTTPException, Response, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 
+from .config import get_settings
 from .schemas import EmailAnalysisResult, ErrorResponse
-from .services import analyzer, text_extractor
-from .rate_limiter import rate_limit
+from .services import analyzer, nlp, openai_client, text_extractor
+from .rate_limiter import get_rate_limiter, rate_limit
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # O warm-up roda em background: /health responde logo, /ready só após o aquecimento
+    app.state.ready = False
+    warmup_task = asyncio.create_task(_warm_up(app))
+    try:
+        yield
+    finally:
+        warmup_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await warmup_task
+
+
+async def _warm_up(app: FastAPI) -> None:
+    started = time.perf_counter()
+    get_rate_limiter(get_settings())
+    results = await asyncio.gather(
+        asyncio.to_thread(nlp.warm_up),
+        asyncio.to_thread(openai_client.warm_up),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, Exception):
+            logger.warning("Falha durante warm-up: %s", result)
+    app.state.ready = True
+    logger.info("Warm-up concluído em %.2fs", time.perf_counter() - started)
+
 
 app = FastAPI(
     title="Email AI Classifier",
     version="0.1.0",
     description="API para classificar emails entre Produtivo/Improdutivo e sugerir respostas automáticas.",
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -27,6 +67,14 @@ def healthcheck() -> dict:
     return {"status": "ok"}
 
 
+@app.get("/ready")
+def readiness(response: Response) -> dict:
+    if not getattr(app.state, "ready", False):
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        return {"status": "warming_up"}
+    return {"status": "ready"}
+
+
 @app.post(
     "/analyze",
     response_model=EmailAnalysisResult,
@@ -36,7 +84,7 @@ async def analyze_email(
     _: None = Depends(rate_limit),
     text: str | None = Form(default=None, description="Texto bruto do email."),
     file: UploadFile | None = None,
-) -> EmailAnalysisResult:
+) -> Response:
     if not text and not file:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -48,13 +96,16 @@ async def analyze_email(
         email_text = await text_extractor.extract_text(file)
 
     try:
-        result = analyzer.analyze(email_text)
+        # A chamada à OpenAI é síncrona e pode levar minutos com retries: roda fora do event loop
+        # para não travar outras requisições nem o heartbeat do worker do gunicorn
+        result = await run_in_threadpool(analyzer.analyze, email_text)
     except ValueError as exc:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(exc),
         ) from exc
-    normalized = email_text.strip() or None
-    return result.model_copy(update={"normalized_text": normalized})
+    result.normalized_text = email_text.strip() or None
+    # Serializa direto pelo pydantic-core: evita a revalidação do response_model e o jsonable_encoder
+    return Response(content=result.model_dump_json(by_alias=True), media_type="application/json")
 
 
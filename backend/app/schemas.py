@@ -17,6 +17,7 @@ class OpenAIUsage(BaseModel):
     prompt_tokens: int = Field(0, alias="promptTokens")
     completion_tokens: int = Field(0, alias="completionTokens")
     total_tokens: int = Field(0, alias="totalTokens")
+    cached_tokens: int = Field(0, alias="cachedTokens")
 
     model_config = ConfigDict(populate_by_name=True)
 
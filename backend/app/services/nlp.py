@@ -2,19 +2,20 @@ from __future__ import annotations
 
 import re
 from functools import lru_cache
-from typing import Dict, List
+from typing import TYPE_CHECKING, Dict, List
 
-try:
-    import spacy
+if TYPE_CHECKING:  # pragma: no cover - apenas para type checkers
     from spacy.language import Language
-except ModuleNotFoundError:  # pragma: no cover - fallback para ambientes sem spaCy
-    spacy = None
-    Language = None
+
+_WARMUP_TEXT = "Please send the status update for the support ticket by tomorrow."
 
 
 @lru_cache
 def get_pipeline() -> Language:
-    if spacy is None:
+    # Import tardio: o spaCy é pesado e só deve ser carregado no warm-up/primeira análise
+    try:
+        import spacy
+    except ModuleNotFoundError:  # pragma: no cover - fallback para ambientes sem spaCy
         return None  # type: ignore[return-value]
     try:
         return spacy.load("en_core_web_sm")  # type: ignore[return-value]
@@ -31,6 +32,11 @@ def get_pipeline() -> Language:
         return nlp  # type: ignore[return-value]
 
 
+def warm_up() -> None:
+    """Carrega o pipeline e executa uma inferência curta para aquecer lookups e caches."""
+    preprocess(_WARMUP_TEXT)
+
+
 def preprocess(text: str) -> Dict[str, List[str]]:
     pipeline = get_pipeline()
     if pipeline is None:
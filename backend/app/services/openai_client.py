@@ -3,15 +3,20 @@ from __future__ import annotations
 import json
 import logging
 from functools import lru_cache
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from fastapi import HTTPException, status
-from openai import OpenAI
 
 from ..config import Settings, get_settings
+
+if TYPE_CHECKING:  # pragma: no cover - apenas para type checkers
+    from openai import OpenAI
+    from openai.types.chat import ChatCompletion
+
 logger = logging.getLogger(__name__)
 
 from ..schemas import EmailAnalysisResult, EmailCategory, OpenAIUsage
+from . import prompts
 
 
 def classify_and_respond(email_text: str, insights: Dict[str, List[str]]) -> EmailAnalysisResult:
@@ -24,41 +29,17 @@ def classify_and_respond(email_text: str, insights: Dict[str, List[str]]) -> Ema
         )
 
     client = _get_client(settings.openai_api_key, settings.openai_base_url)
-    messages = _build_messages(email_text, insights)
-    response_schema: Dict[str, Any] = {
-        "name": "email_classification_payload",
-        "strict": True,
-        "schema": {
-            "type": "object",
-            "properties": {
-                "category": {
-                    "type": "string",
-                    "enum": [
-                        EmailCategory.productive.value,
-                        EmailCategory.unproductive.value,
-                    ],
-                },
-                "confidence": {"type": "number"},
-                "suggested_response": {"type": "string"},
-                "justification": {"type": ["string", "null"]},
-                "highlights": {
-                    "type": ["array", "null"],
-                    "items": {"type": "string"},
-                },
-                "raw_labels": {
-                    "type": ["array", "null"],
-                    "items": {"type": "string"},
-                },
-            },
-            "required": ["category", "confidence", "suggested_response", "justification", "highlights", "raw_labels"],
-            "additionalProperties": False,
-        },
-    }
+    messages = prompts.build_messages(
+        email_text,
+        insights,
+        max_tokens=settings.prompt_max_tokens,
+        max_key_phrases=settings.prompt_max_key_phrases,
+    )
     try:
-        data = _call_chat_completion_with_retry(
+        return _call_chat_completion_with_retry(
             client,
             messages,
-            response_schema=response_schema,
+            response_format=prompts.RESPONSE_FORMAT,
             settings=settings,
         )
     except HTTPException:
@@ -69,46 +50,14 @@ def classify_and_respond(email_text: str, insights: Dict[str, List[str]]) -> Ema
             detail=f"Falha ao consultar OpenAI: {exc}",
         ) from exc
 
-    return EmailAnalysisResult(**data)
-
-
-def _build_messages(email_text: str, insights: Dict[str, List[str]]) -> List[Dict[str, str]]:
-    tokens = ", ".join(insights.get("tokens", [])[:25]) or "nenhum"
-    key_phrases = "; ".join(insights.get("key_phrases", [])) or "nenhuma"
-    instructions = (
-        "Você é um assistente que classifica emails recebidos em português ou inglês. "
-        "Categorias possíveis: Produtivo (requer ação/resposta) ou Improdutivo (sem ação imediata). "
-        "Respostas devem soar humanas, empáticas e proativas: cumprimente, agradeça o contato, descreva o que já foi feito ou será feito, cite próximos passos com prazos quando disponíveis e encerre cordialmente. "
-        "Prefira parágrafos coesos em vez de listas ou rótulos fixos (evite 'Status:', 'Próximos passos:' etc.). "
-        "Use linguagem acessível e positiva. Quando classificar como Improdutivo (apenas cordialidades), agradeça e deseje bons votos, sem falar de 'status' nem pendências."
-        "Retorne SEMPRE um JSON válido com os campos: "
-        "category (Produtivo ou Improdutivo), confidence (0-1), "
-        "suggested_response (texto curto e cordial em português), "
-        "justification (frase explicando), highlights (lista com até 3 trechos relevantes), "
-        "raw_labels (lista de rótulos auxiliares). "
-        "A resposta sugerida deve alinhar com a categoria e oferecer próximo passo adequado."
-        "Mencione explicitamente o status atual e indique se existem pendências relevantes;"
-        "Caso não haja, registre essa informação de forma objetiva."
-    )
-    user_input = (
-        f"Email:\n\"\"\"\n{email_text.strip()}\n\"\"\"\n\n"
-        f"Tokens limpos: {tokens}\n"
-        f"Frases-chave: {key_phrases}\n"
-        "Retorne somente o JSON. Nada além do JSON."
-    )
-    return [
-        {"role": "system", "content": instructions},
-        {"role": "user", "content": user_input},
-    ]
-
 
 def _call_chat_completion_with_retry(
     client: OpenAI,
     messages: List[Dict[str, str]],
     *,
-    response_schema: Dict[str, Any],
+    response_format: Dict[str, Any],
     settings: Settings,
-) -> Dict[str, Any]:
+) -> EmailAnalysisResult:
     # Tenta com valores crescentes para evitar finish_reason=length
     base_tokens = settings.max_output_tokens or 2000
     attempts = [
@@ -118,11 +67,6 @@ def _call_chat_completion_with_retry(
     ]
     last_error: Optional[Exception] = None
 
-    response_format: Dict[str, Any] = {
-        "type": "json_schema",
-        "json_schema": response_schema,
-    }
-
     for max_tokens in attempts:
         try:
             completion = client.chat.completions.create(
@@ -132,18 +76,16 @@ def _call_chat_completion_with_retry(
                 timeout=settings.request_timeout,
                 response_format=response_format,
             )
-            completion_dump = completion.model_dump()
             if settings.debug_openai_payload:
                 _log_openai_payload(
-                    f"chat_completions_retry_{max_tokens}",
-                    completion_dump,
+                    f"chat_completions_prompt_v{prompts.PROMPT_VERSION}_retry_{max_tokens}",
+                    completion,
                 )
             
-            # Verifica se completou corretamente
-            choices = completion_dump.get("choices") or []
+            # Verifica se completou corretamente (lê os objetos tipados do SDK, sem model_dump)
+            choices = completion.choices
             if choices:
-                finish_reason = choices[0].get("finish_reason", "")
-                if finish_reason == "length":
+                if choices[0].finish_reason == "length":
                     # Se atingiu o limite, tenta com mais tokens na próxima iteração
                     if max_tokens == attempts[-1]:
                         # Já tentou com o máximo, não adianta continuar
@@ -153,7 +95,7 @@ def _call_chat_completion_with_retry(
                         )
                     continue  # Tenta próxima iteração com mais tokens
             
-            return _parse_chat_completion(completion_dump, settings)
+            return _parse_chat_completion(completion, settings)
         except HTTPException as exc:
             last_error = exc
             if exc.status_code != status.HTTP_502_BAD_GATEWAY:
@@ -173,18 +115,17 @@ def _call_chat_completion_with_retry(
     )
 
 
-def _parse_chat_completion(completion_dump: Dict[str, Any], settings: Settings) -> Dict[str, Any]:
-    choices = completion_dump.get("choices") or []
+def _parse_chat_completion(completion: ChatCompletion, settings: Settings) -> EmailAnalysisResult:
+    choices = completion.choices
     if not choices:
         raise HTTPException(
             status_code=status.HTTP_502_BAD_GATEWAY,
             detail="Resposta da OpenAI veio sem choices.",
         )
-    message = choices[0].get("message") or {}
-    content = message.get("content") or ""
+    content = choices[0].message.content or ""
     
     if not content or not content.strip():
-        finish_reason = choices[0].get("finish_reason", "unknown")
+        finish_reason = choices[0].finish_reason or "unknown"
         raise HTTPException(
             status_code=status.HTTP_502_BAD_GATEWAY,
             detail=f"Resposta inesperada da OpenAI: conteúdo vazio (finish_reason={finish_reason})",
@@ -192,7 +133,7 @@ def _parse_chat_completion(completion_dump: Dict[str, Any], settings: Settings)
     
     payload = _load_payload(content)
 
-    _ensure_required_fields(payload, completion_dump, settings, source="chat_completions")
+    _ensure_required_fields(payload, completion, settings, source="chat_completions")
 
     category = payload["category"]
     if category not in (EmailCategory.productive.value, EmailCategory.unproductive.value):
@@ -202,29 +143,58 @@ def _parse_chat_completion(completion_dump: Dict[str, Any], settings: Settings)
         )
 
     usage = None
-    usage_dump = completion_dump.get("usage")
-    if usage_dump:
-        usage = OpenAIUsage.parse_obj(
-            {
-                "promptTokens": usage_dump.get("prompt_tokens"),
-                "completionTokens": usage_dump.get("completion_tokens"),
-                "totalTokens": usage_dump.get("total_tokens"),
-            }
+    if completion.usage is not None:
+        usage = OpenAIUsage(
+            prompt_tokens=completion.usage.prompt_tokens,
+            completion_tokens=completion.usage.completion_tokens,
+            total_tokens=completion.usage.total_tokens,
+            cached_tokens=_cached_tokens(completion.usage),
         )
 
-    return {
-        "category": category,
-        "suggested_response": payload["suggested_response"],
-        "confidence": _normalize_confidence(payload["confidence"]),
-        "justification": payload.get("justification"),
-        "highlights": payload.get("highlights") or None,
-        "raw_labels": payload.get("raw_labels") or None,
-        "usage": usage,
-    }
+    # Única validação do resultado: instâncias já validadas (usage) não são revalidadas
+    return EmailAnalysisResult(
+        category=category,
+        suggested_response=payload["suggested_response"],
+        confidence=_normalize_confidence(payload["confidence"]),
+        justification=payload.get("justification"),
+        highlights=payload.get("highlights") or None,
+        raw_labels=payload.get("raw_labels") or None,
+        usage=usage,
+    )
+
+
+def warm_up() -> None:
+    """Cria o cliente compartilhado e, se habilitado, abre a conexão TLS do pool HTTP."""
+    settings = get_settings()
+    if not settings.openai_api_key:
+        return
+
+    client = _get_client(settings.openai_api_key, settings.openai_base_url)
+    if not settings.warmup_openai_connection:
+        return
+    try:
+        # Sem retries e com timeout curto: OpenAI lenta não pode segurar o /ready (health check do LB).
+        # with_options reaproveita o mesmo httpx.Client, então a conexão aberta fica no pool compartilhado.
+        client.with_options(max_retries=0, timeout=settings.warmup_timeout).models.retrieve(settings.openai_model)
+    except Exception:  # pragma: no cover - warm-up não deve derrubar o startup
+        logger.warning("Falha ao pré-aquecer conexão com a OpenAI", exc_info=True)
+
+
+def _cached_tokens(usage: Any) -> int:
+    # openai==1.47 ainda não tipa prompt_tokens_details: chega como extra (dict) no CompletionUsage
+    details = getattr(usage, "prompt_tokens_details", None)
+    if details is None:
+        return 0
+    if isinstance(details, dict):
+        return details.get("cached_tokens") or 0
+    return getattr(details, "cached_tokens", None) or 0
 
 
 @lru_cache
 def _get_client(api_key: str, base_url: Optional[str]) -> OpenAI:
+    # Import tardio: o SDK da OpenAI tem custo de import relevante no cold start
+    from openai import OpenAI
+
     client_kwargs: Dict[str, Any] = {"api_key": api_key}
     if base_url:
         client_kwargs["base_url"] = base_url
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+from ..schemas import EmailCategory
+
+# Incrementar sempre que o texto das instruções ou o schema mudar: qualquer byte
+# diferente no prefixo invalida o cache de prompt do provedor.
+PROMPT_VERSION = "2"
+
+# Prefixo estático (idêntico byte a byte em toda requisição) vem primeiro para que o
+# cache de prompt da OpenAI possa reaproveitá-lo. O cache só vale a partir de 1024 tokens
+# e instruções + schema somam ~500 hoje, então cached_tokens fica 0 até o prefixo crescer.
+SYSTEM_INSTRUCTIONS = " ".join(
+    (
+        "Você é um assistente que classifica emails recebidos em português ou inglês.",
+        "Categorias possíveis: Produtivo (requer ação/resposta) ou Improdutivo (sem ação imediata).",
+        "Respostas devem soar humanas, empáticas e proativas: cumprimente, agradeça o contato, descreva o que já foi feito ou será feito, cite próximos passos com prazos quando disponíveis e encerre cordialmente.",
+        "Prefira parágrafos coesos em vez de listas ou rótulos fixos (evite 'Status:', 'Próximos passos:' etc.).",
+        "Use linguagem acessível e positiva. Quando classificar como Improdutivo (apenas cordialidades), agradeça e deseje bons votos, sem falar de 'status' nem pendências.",
+        "Retorne SEMPRE um JSON válido com os campos:",
+        "category (Produtivo ou Improdutivo), confidence (0-1),",
+        "suggested_response (texto curto e cordial em português),",
+        "justification (frase explicando), highlights (lista com até 3 trechos relevantes),",
+        "raw_labels (lista de rótulos auxiliares).",
+        "A resposta sugerida deve alinhar com a categoria e oferecer próximo passo adequado.",
+        "Mencione explicitamente o status atual e indique se existem pendências relevantes;",
+        "caso não haja, registre essa informação de forma objetiva.",
+        "A mensagem do usuário traz, quando disponíveis, termos (lemas extraídos) e frases (frases-chave), seguidos do email entre aspas triplas.",
+        "Retorne somente o JSON. Nada além do JSON.",
+    )
+)
+
+SYSTEM_MESSAGE: Dict[str, str] = {"role": "system", "content": SYSTEM_INSTRUCTIONS}
+
+RESPONSE_SCHEMA: Dict[str, Any] = {
+    "name": "email_classification_payload",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {
+            "category": {
+                "type": "string",
+                "enum": [
+                    EmailCategory.productive.value,
+                    EmailCategory.unproductive.value,
+                ],
+            },
+            "confidence": {"type": "number"},
+            "suggested_response": {"type": "string"},
+            "justification": {"type": ["string", "null"]},
+            "highlights": {
+                "type": ["array", "null"],
+                "items": {"type": "string"},
+            },
+            "raw_labels": {
+                "type": ["array", "null"],
+                "items": {"type": "string"},
+            },
+        },
+        "required": ["category", "confidence", "suggested_response", "justification", "highlights", "raw_labels"],
+        "additionalProperties": False,
+    },
+}
+
+RESPONSE_FORMAT: Dict[str, Any] = {
+    "type": "json_schema",
+    "json_schema": RESPONSE_SCHEMA,
+}
+
+
+def build_messages(
+    email_text: str,
+    insights: Dict[str, List[str]],
+    *,
+    max_tokens: int,
+    max_key_phrases: int,
+) -> List[Dict[str, str]]:
+    return [
+        SYSTEM_MESSAGE,
+        {"role": "user", "content": _build_user_content(email_text, insights, max_tokens, max_key_phrases)},
+    ]
+
+
+def _build_user_content(
+    email_text: str,
+    insights: Dict[str, List[str]],
+    max_tokens: int,
+    max_key_phrases: int,
+) -> str:
+    lines: List[str] = []
+    if max_tokens > 0:
+        # dict.fromkeys remove lemas repetidos preservando a ordem de aparição
+        tokens = list(dict.fromkeys(insights.get("tokens", [])))[:max_tokens]
+        lines.append(f"termos: {','.join(tokens) or '-'}")
+    if max_key_phrases > 0:
+        key_phrases = insights.get("key_phrases", [])[:max_key_phrases]
+        lines.append(f"frases: {';'.join(key_phrases) or '-'}")
+    lines.append(f'email:\n"""\n{email_text.strip()}\n"""')
+    return "\n".join(lines)
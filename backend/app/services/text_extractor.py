@@ -4,7 +4,6 @@ import io
 from typing import Optional
 
 from fastapi import HTTPException, UploadFile, status
-from PyPDF2 import PdfReader
 
 ALLOWED_MIME_TYPES = {
     "text/plain",
@@ -33,6 +32,9 @@ async def extract_text(file: UploadFile) -> str:
 
 
 def _read_pdf(raw: bytes) -> str:
+    # Import tardio: PyPDF2 só é necessário quando chega um PDF
+    from PyPDF2 import PdfReader
+
     try:
         buffer = io.BytesIO(raw)
         reader = PdfReader(buffer)
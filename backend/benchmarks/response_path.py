@@ -0,0 +1,138 @@
+"""Compara o custo de CPU e de alocação do caminho de resposta por requisição.
+
+- legado: ``completion.model_dump()`` -> dicts -> ``OpenAIUsage.parse_obj`` ->
+  ``EmailAnalysisResult(**data)`` -> ``model_copy`` -> revalidação do ``response_model``
+  + ``jsonable_encoder``/``json.dumps`` do FastAPI;
+- atual: objetos tipados do SDK -> uma validação -> ``model_dump_json``.
+
+Uso (a partir de ``backend/``)::
+
+    python -m benchmarks.response_path --iterations 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import time
+import tracemalloc
+import warnings
+from typing import Any, Callable, Dict
+
+os.environ.setdefault("OPENAI_API_KEY", "benchmark-key")
+
+from fastapi.responses import JSONResponse  # noqa: E402
+from fastapi.routing import serialize_response  # noqa: E402
+from openai.types.chat import ChatCompletion  # noqa: E402
+
+from app.config import get_settings  # noqa: E402
+from app.main import app  # noqa: E402
+from app.schemas import EmailAnalysisResult, OpenAIUsage  # noqa: E402
+from app.services.openai_client import _load_payload, _normalize_confidence, _parse_chat_completion  # noqa: E402
+
+EMAIL_TEXT = "Olá, preciso do status da solicitação 45821 aberta na semana passada. Obrigado!"
+COMPLETION = ChatCompletion.model_validate(
+    {
+        "id": "chatcmpl-benchmark",
+        "object": "chat.completion",
+        "created": 0,
+        "model": "gpt-5-mini",
+        "choices": [
+            {
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {
+                    "role": "assistant",
+                    "content": (
+                        '{"category": "Produtivo", "confidence": 0.93, '
+                        '"suggested_response": "Olá! Obrigado pelo contato. Já localizamos a solicitação 45821 '
+                        'e a equipe responsável está finalizando a análise; retornaremos até amanhã com a conclusão.", '
+                        '"justification": "Cliente solicita atualização de um chamado em aberto.", '
+                        '"highlights": ["status da solicitação 45821"], "raw_labels": ["status", "suporte"]}'
+                    ),
+                },
+            }
+        ],
+        "usage": {"prompt_tokens": 412, "completion_tokens": 96, "total_tokens": 508},
+    }
+)
+LOOP = asyncio.new_event_loop()
+ANALYZE_ROUTE = next(route for route in app.routes if getattr(route, "path", None) == "/analyze")
+
+
+def legacy_path() -> bytes:
+    completion_dump = COMPLETION.model_dump()
+    choices = completion_dump.get("choices") or []
+    choices[0].get("finish_reason", "")
+    message = choices[0].get("message") or {}
+    payload = _load_payload(message.get("content") or "")
+    usage_dump = completion_dump.get("usage")
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        usage = OpenAIUsage.parse_obj(
+            {
+                "promptTokens": usage_dump.get("prompt_tokens"),
+                "completionTokens": usage_dump.get("completion_tokens"),
+                "totalTokens": usage_dump.get("total_tokens"),
+            }
+        )
+    data: Dict[str, Any] = {
+        "category": payload["category"],
+        "suggested_response": payload["suggested_response"],
+        "confidence": _normalize_confidence(payload["confidence"]),
+        "justification": payload.get("justification"),
+        "highlights": payload.get("highlights") or None,
+        "raw_labels": payload.get("raw_labels") or None,
+        "usage": usage,
+    }
+    result = EmailAnalysisResult(**data).model_copy(update={"normalized_text": EMAIL_TEXT.strip() or None})
+    content = LOOP.run_until_complete(
+        serialize_response(field=ANALYZE_ROUTE.secure_cloned_response_field, response_content=result, is_coroutine=True)
+    )
+    return JSONResponse(content).body
+
+
+def current_path() -> bytes:
+    result = _parse_chat_completion(COMPLETION, get_settings())
+    result.normalized_text = EMAIL_TEXT.strip() or None
+    return result.model_dump_json(by_alias=True).encode()
+
+
+def measure(path: Callable[[], bytes], iterations: int) -> tuple[float, float]:
+    for _ in range(min(iterations, 500)):
+        path()
+
+    started = time.process_time()
+    for _ in range(iterations):
+        path()
+    cpu_us = (time.process_time() - started) / iterations * 1_000_000
+
+    tracemalloc.start()
+    peak = 0
+    for _ in range(min(iterations, 2000)):
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        path()
+        peak = max(peak, tracemalloc.get_traced_memory()[1] - before)
+    tracemalloc.stop()
+    return cpu_us, peak / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    legacy_cpu, legacy_peak = measure(legacy_path, args.iterations)
+    current_cpu, current_peak = measure(current_path, args.iterations)
+
+    print(f"{'caminho':>8} {'CPU/req (µs)':>13} {'pico alocado/req (KiB)':>23}")
+    print(f"{'legado':>8} {legacy_cpu:>13.1f} {legacy_peak:>23.1f}")
+    print(f"{'atual':>8} {current_cpu:>13.1f} {current_peak:>23.1f}")
+    print(f"redução de CPU: {(1 - current_cpu / legacy_cpu) * 100:.0f}% | req/s por núcleo: "
+          f"{1_000_000 / legacy_cpu:.0f} -> {1_000_000 / current_cpu:.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Mede o custo de cold start do backend.
+
+- import: tempo de ``import app.main`` em um interpretador novo (mediana de N execuções);
+- time-to-first-request: tempo entre subir o uvicorn e o primeiro 200 em ``/health``
+  e, em seguida, em ``/ready`` (warm-up concluído).
+
+Uso (a partir de ``backend/``)::
+
+    python benchmarks/startup.py --runs 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+IMPORT_SNIPPET = (
+    "import time; started = time.perf_counter(); import app.main; "
+    "print(time.perf_counter() - started)"
+)
+
+
+def measure_import(runs: int) -> list[float]:
+    samples: list[float] = []
+    for _ in range(runs):
+        output = subprocess.check_output(
+            [sys.executable, "-c", IMPORT_SNIPPET],
+            cwd=BACKEND_DIR,
+            env=_env(),
+            text=True,
+        )
+        samples.append(float(output.strip().splitlines()[-1]))
+    return samples
+
+
+def measure_first_request(port: int, timeout: float) -> tuple[float, float]:
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--host", "127.0.0.1", "--port", str(port)],
+        cwd=BACKEND_DIR,
+        env=_env(),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        health = _wait_for(server, f"http://127.0.0.1:{port}/health", started, timeout)
+        ready = _wait_for(server, f"http://127.0.0.1:{port}/ready", started, timeout)
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+    return health, ready
+
+
+def _wait_for(server: subprocess.Popen, url: str, started: float, timeout: float) -> float:
+    while time.perf_counter() - started < timeout:
+        if server.poll() is not None:
+            raise RuntimeError(f"uvicorn encerrou com código {server.returncode} antes de responder")
+        try:
+            with urllib.request.urlopen(url, timeout=1) as response:
+                if response.status == 200:
+                    return time.perf_counter() - started
+        except (urllib.error.URLError, ConnectionError):
+            pass
+        time.sleep(0.01)
+    raise TimeoutError(f"{url} não respondeu 200 em {timeout:.0f}s")
+
+
+def _env() -> dict[str, str]:
+    env = dict(os.environ)
+    env.setdefault("OPENAI_API_KEY", "benchmark-key")
+    # Sem rede por padrão: o benchmark mede o custo local do warm-up
+    env.setdefault("OPENAI_WARMUP_CONNECTION", "false")
+    return env
+
+
+def _summary(samples: list[float]) -> str:
+    return f"mediana={statistics.median(samples) * 1000:.0f}ms min={min(samples) * 1000:.0f}ms max={max(samples) * 1000:.0f}ms"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--timeout", type=float, default=60.0)
+    args = parser.parse_args()
+
+    print(f"import app.main      {_summary(measure_import(args.runs))}")
+
+    health_samples: list[float] = []
+    ready_samples: list[float] = []
+    for _ in range(args.runs):
+        health, ready = measure_first_request(args.port, args.timeout)
+        health_samples.append(health)
+        ready_samples.append(ready)
+    print(f"primeiro 200 /health {_summary(health_samples)}")
+    print(f"primeiro 200 /ready  {_summary(ready_samples)}")
+
+
+if __name__ == "__main__":
+    main()
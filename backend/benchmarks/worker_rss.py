@@ -0,0 +1,135 @@
+"""Mede a memória por processo do servidor (Linux, via /proc/<pid>/smaps_rollup).
+
+Compara o ``CMD`` antigo (uvicorn, opcionalmente com ``--workers``) com o modo
+pre-fork do gunicorn (``gunicorn.conf.py``). Para cada processo reporta RSS, PSS
+(RSS rateado pelas páginas compartilhadas) e a parcela compartilhada/privada.
+
+Uso (a partir de ``backend/``)::
+
+    python benchmarks/worker_rss.py --mode uvicorn --workers 2
+    python benchmarks/worker_rss.py --mode gunicorn --workers 2
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+FIELDS = ("Rss", "Pss", "Shared_Clean", "Shared_Dirty", "Private_Clean", "Private_Dirty")
+
+
+def build_command(mode: str, workers: int, port: int) -> list[str]:
+    if mode == "gunicorn":
+        return [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py", "app.main:app"]
+    command = [sys.executable, "-m", "uvicorn", "app.main:app", "--host", "127.0.0.1", "--port", str(port)]
+    if workers > 1:
+        command += ["--workers", str(workers)]
+    return command
+
+
+def read_memory(pid: int) -> dict[str, int]:
+    values = dict.fromkeys(FIELDS, 0)
+    with open(f"/proc/{pid}/smaps_rollup") as handle:
+        for line in handle:
+            name, _, rest = line.partition(":")
+            if name in values:
+                values[name] = int(rest.split()[0])
+    return values
+
+
+def descendants(root: int) -> list[int]:
+    children: dict[int, list[int]] = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as handle:
+                stat = handle.read()
+        except OSError:
+            continue
+        ppid = int(stat.rsplit(")", 1)[1].split()[1])
+        children.setdefault(ppid, []).append(int(entry))
+
+    found: list[int] = []
+    pending = [root]
+    while pending:
+        pid = pending.pop()
+        found.append(pid)
+        pending.extend(children.get(pid, []))
+    return found
+
+
+def wait_ready(port: int, requests: int, timeout: float) -> None:
+    started = time.perf_counter()
+    served = 0
+    while served < requests:
+        if time.perf_counter() - started > timeout:
+            raise TimeoutError("servidor não ficou pronto a tempo")
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/ready", timeout=5) as response:
+                if response.status == 200:
+                    served += 1
+                    continue
+        except (urllib.error.URLError, ConnectionError, TimeoutError):
+            pass
+        time.sleep(0.05)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mode", choices=("uvicorn", "gunicorn"), default="gunicorn")
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--settle", type=float, default=2.0, help="segundos de espera após o /ready")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    env.setdefault("OPENAI_API_KEY", "benchmark-key")
+    env.setdefault("OPENAI_WARMUP_CONNECTION", "false")
+    env["WEB_CONCURRENCY"] = str(args.workers)
+    env["BIND"] = f"127.0.0.1:{args.port}"
+
+    server = subprocess.Popen(
+        build_command(args.mode, args.workers, args.port),
+        cwd=BACKEND_DIR,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        # Várias chamadas para que cada worker tenha concluído seu warm-up
+        wait_ready(args.port, requests=args.workers * 10, timeout=args.timeout)
+        time.sleep(args.settle)
+        pids = descendants(server.pid)
+        # No uvicorn --workers também aparece o resource tracker do multiprocessing (processo pequeno)
+        rows = [(pid, read_memory(pid)) for pid in pids]
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+    print(f"modo={args.mode} workers={args.workers}")
+    print(f"{'pid':>8} {'papel':>8} {'RSS MiB':>9} {'PSS MiB':>9} {'compart.':>9} {'privado':>9}")
+    totals = dict.fromkeys(FIELDS, 0)
+    for pid, memory in rows:
+        role = "master" if pid == server.pid and len(rows) > 1 else "filho"
+        shared = memory["Shared_Clean"] + memory["Shared_Dirty"]
+        private = memory["Private_Clean"] + memory["Private_Dirty"]
+        print(
+            f"{pid:>8} {role:>8} {memory['Rss'] / 1024:>9.1f} {memory['Pss'] / 1024:>9.1f} "
+            f"{shared / 1024:>9.1f} {private / 1024:>9.1f}"
+        )
+        for field in FIELDS:
+            totals[field] += memory[field]
+    print(f"{'total':>17} {totals['Rss'] / 1024:>9.1f} {totals['Pss'] / 1024:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Configuração do servidor de produção (gunicorn pre-fork + workers uvicorn).
+
+O app e o estado somente leitura (pipeline spaCy, settings, módulos pesados) são
+carregados uma única vez no processo master; os workers são criados via fork e
+compartilham essas páginas de memória em copy-on-write.
+
+Sinais úteis:
+- ``HUP``: recria os workers de forma graceful (relê esta configuração);
+- ``USR2`` + ``QUIT`` no master antigo: sobe uma nova versão do código sem derrubar conexões.
+"""
+
+import gc
+import os
+
+bind = os.getenv("BIND", "0.0.0.0:8000")
+workers = int(os.getenv("WEB_CONCURRENCY", "2"))
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = True
+
+# Reciclagem de workers: limita crescimento de memória (e de páginas que deixaram de ser compartilhadas)
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "1000"))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", "100"))
+
+# Com UvicornWorker, `timeout` é o heartbeat do worker (não um limite por requisição): o master
+# reinicia o worker se o event loop não o notificar nesse intervalo. /analyze chama a OpenAI em
+# uma thread (run_in_threadpool), então o loop segue livre e o default do gunicorn basta.
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "30"))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", "5"))
+
+accesslog = "-"
+errorlog = "-"
+
+
+def when_ready(server):
+    # Roda no master antes do primeiro fork: só estado somente leitura e sem sockets abertos.
+    # O cliente OpenAI (pool HTTP) é criado em cada worker pelo lifespan do app.
+    import openai  # noqa: F401
+    import PyPDF2  # noqa: F401
+
+    from app.config import get_settings
+    from app.services import nlp
+
+    get_settings()
+    nlp.warm_up()
+    gc.collect()
+    gc.freeze()
+    server.log.info("Estado pré-carregado no master; workers compartilharão as páginas via copy-on-write")
+
+
+def pre_fork(server, worker):
+    # Mantém fora do GC tudo que o master alocou (inclusive após HUP), evitando que
+    # a coleta nos workers toque nos headers dos objetos e quebre o compartilhamento.
+    gc.freeze()
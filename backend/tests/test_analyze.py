@@ -1,14 +1,20 @@
 from io import BytesIO
 
 import os
+import threading
+import time
 
 os.environ.setdefault("OPENAI_API_KEY", "test-key")
 
 import pytest
 from fastapi.testclient import TestClient
+from openai.types.chat import ChatCompletion
 
+from backend.app.config import get_settings
 from backend.app.main import app
-from backend.app.schemas import EmailAnalysisResult, EmailCategory
+from backend.app.schemas import EmailAnalysisResult, EmailCategory, OpenAIUsage
+from backend.app.services import prompts
+from backend.app.services.openai_client import _parse_chat_completion
 
 client = TestClient(app)
 
@@ -62,3 +68,100 @@ def test_analyze_missing_payload():
     assert "Envie um texto ou arquivo" in response.json()["detail"]
 
 
+def test_ready_waits_for_warm_up(monkeypatch):
+    release = threading.Event()
+    monkeypatch.setattr("backend.app.services.nlp.warm_up", lambda: release.wait(5))
+    monkeypatch.setattr("backend.app.services.openai_client.warm_up", lambda: None)
+
+    with TestClient(app) as warming_client:
+        assert warming_client.get("/health").status_code == 200
+        response = warming_client.get("/ready")
+        assert response.status_code == 503
+        assert response.json()["status"] == "warming_up"
+
+        release.set()
+        for _ in range(50):
+            response = warming_client.get("/ready")
+            if response.status_code == 200:
+                break
+            time.sleep(0.05)
+        assert response.status_code == 200
+        assert response.json()["status"] == "ready"
+
+
+def test_parse_chat_completion_reads_typed_completion():
+    completion = ChatCompletion.model_validate(
+        {
+            "id": "chatcmpl-test",
+            "object": "chat.completion",
+            "created": 0,
+            "model": "gpt-5-mini",
+            "choices": [
+                {
+                    "index": 0,
+                    "finish_reason": "stop",
+                    "message": {
+                        "role": "assistant",
+                        "content": (
+                            '{"category": "Produtivo", "confidence": 1.4, '
+                            '"suggested_response": "Olá! Vamos verificar.", "justification": null, '
+                            '"highlights": [], "raw_labels": ["suporte"]}'
+                        ),
+                    },
+                }
+            ],
+            "usage": {
+                "prompt_tokens": 120,
+                "completion_tokens": 30,
+                "total_tokens": 150,
+                "prompt_tokens_details": {"cached_tokens": 64},
+            },
+        }
+    )
+
+    result = _parse_chat_completion(completion, get_settings())
+
+    assert result.category == EmailCategory.productive
+    assert result.confidence == 1.0
+    assert result.highlights is None
+    assert result.raw_labels == ["suporte"]
+    assert result.usage == OpenAIUsage(prompt_tokens=120, completion_tokens=30, total_tokens=150, cached_tokens=64)
+
+
+def test_analyze_serializes_usage_with_aliases(monkeypatch):
+    def fake_analyze(text: str) -> EmailAnalysisResult:
+        return EmailAnalysisResult(
+            category=EmailCategory.productive,
+            suggested_response="Olá! Recebemos sua solicitação.",
+            confidence=0.8,
+            usage=OpenAIUsage(prompt_tokens=10, completion_tokens=5, total_tokens=15),
+        )
+
+    monkeypatch.setattr("backend.app.services.analyzer.analyze", fake_analyze)
+
+    response = client.post("/analyze", data={"text": "  Status da solicitação 45821  "})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    payload = response.json()
+    assert payload["normalized_text"] == "Status da solicitação 45821"
+    assert payload["usage"] == {"promptTokens": 10, "completionTokens": 5, "totalTokens": 15, "cachedTokens": 0}
+
+
+def test_prompt_prefix_is_stable_and_insights_are_compact():
+    first = prompts.build_messages(
+        "Preciso do status do chamado 123.",
+        {"tokens": ["status", "chamado", "status", "123"], "key_phrases": ["status do chamado"]},
+        max_tokens=2,
+        max_key_phrases=10,
+    )
+    second = prompts.build_messages(
+        "Obrigado pela parceria!",
+        {"tokens": ["obrigado"], "key_phrases": []},
+        max_tokens=0,
+        max_key_phrases=0,
+    )
+
+    assert first[0] is second[0] is prompts.SYSTEM_MESSAGE
+    assert first[1]["content"].startswith("termos: status,chamado\nfrases: status do chamado\nemail:")
+    assert second[1]["content"] == 'email:\n"""\nObrigado pela parceria!\n"""'
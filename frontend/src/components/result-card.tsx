@@ -147,6 +147,13 @@ export function ResultCard({ result, onCopyResponse }: ResultCardProps) {
               value={result.usage?.promptTokens}
               tone="text-slate-400"
             />
+            {result.usage?.cachedTokens ? (
+              <MetricCard
+                label="Tokens em cache"
+                value={result.usage.cachedTokens}
+                tone="text-slate-400"
+              />
+            ) : null}
             <MetricCard
               label="Tokens resposta"
               value={result.usage?.completionTokens}
@@ -158,7 +165,11 @@ export function ResultCard({ result, onCopyResponse }: ResultCardProps) {
               tone="text-slate-200"
               highlight
             />
-            <div className="rounded-2xl border border-orange-500/20 bg-orange-500/10 p-4 text-xs text-orange-100/75">
+            <div
+              className={`rounded-2xl border border-orange-500/20 bg-orange-500/10 p-4 text-xs text-orange-100/75 ${
+                result.usage?.cachedTokens ? "lg:col-span-2" : ""
+              }`}
+            >
               <p className="font-semibold uppercase tracking-[0.3em] text-orange-100/75">
                 Diretriz de ação
               </p>
@@ -13,6 +13,7 @@ export interface EmailAnalysisResponse {
     promptTokens?: number;
     completionTokens?: number;
     totalTokens?: number;
+    cachedTokens?: number;
   } | null;
   raw_labels?: string[] | null;
 }